@@ -0,0 +1,46 @@
+"""
+BOUNTY DATABASE (SQLITE)
+========================
+
+Stores the bounty board in SQLite so each command only writes the rows it
+changes, inside one transaction, instead of rewriting the whole board.
+"""
+
+import sqlite3
+from typing import Dict, Iterable
+
+
+def connect(path: str) -> sqlite3.Connection:
+    """Open the database, creating the bounty table if needed"""
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS bounty (name TEXT PRIMARY KEY, score INTEGER NOT NULL)")
+    conn.commit()
+    return conn
+
+
+def load_board(conn: sqlite3.Connection) -> Dict[str, int]:
+    """Read the full bounty board"""
+    return dict(conn.execute("SELECT name, score FROM bounty"))
+
+
+def apply_changes(conn: sqlite3.Connection, updated: Dict[str, int],
+                  removed: Iterable[str] = (), reset: bool = False):
+    """
+    Write a set of bounty board changes in a single transaction.
+
+    Args:
+        conn: Database connection
+        updated: New bounty for each added or changed player
+        removed: Players to delete
+        reset: Clear the whole board first
+    """
+    with conn:
+        if reset:
+            conn.execute("DELETE FROM bounty")
+        conn.executemany("DELETE FROM bounty WHERE name = ?", ((name,) for name in removed))
+        conn.executemany(
+            "INSERT INTO bounty (name, score) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET score = excluded.score",
+            updated.items()
+        )
@@ -6,6 +6,9 @@ DEPENDENCIES INSTALLATION:
 --------------------------
 pip install discord.py pillow easyocr aiohttp numpy
 
+Optional speedups (used automatically when installed):
+pip install rapidfuzz orjson sortedcontainers
+
 For Tesseract OCR (alternative to EasyOCR):
 - Windows: Download installer from https://github.com/UB-Mannheim/tesseract/wiki
   Install to C:\\Program Files\\Tesseract-OCR\\ and add to PATH
@@ -17,6 +20,13 @@ For Tesseract OCR (alternative to EasyOCR):
 - Linux: sudo apt-get install tesseract-ocr
   Then: pip install pytesseract
 
+  Optionally also pip install tesserocr, which keeps Tesseract loaded in the
+  bot process instead of starting the tesseract program for every screenshot
+
+For the OpenVINO backend (faster EasyOCR on Intel CPUs):
+- pip install openvino
+  Then install an OpenVINO-enabled EasyOCR build in place of the stock easyocr package
+
 SETUP:
 ------
 1. Create a Discord bot at https://discord.com/developers/applications
@@ -34,26 +44,109 @@ from discord.ui import View, Button, Select
 import discord
 from discord import app_commands
 from discord.ext import commands
+import asyncio
+import atexit
+import bisect
+import hashlib
+import itertools
+import logging
 import re
 import json
 import os
-from typing import Dict, List, Optional, Tuple
+import string
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import aiohttp
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-from PIL import Image
+from PIL import Image, ImageOps
 import numpy as np
 
-# Choose OCR engine: 'easyocr' (recommended) or 'tesseract'
+import bounty_db
+
+# rapidfuzz (optional) lets header detection tolerate dropped/swapped letters
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+# orjson (optional) serializes the JSON board several times faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# sortedcontainers (optional) keeps the leaderboard ordered with O(log N) updates
+try:
+    from sortedcontainers import SortedList
+except ImportError:
+    SortedList = None
+
+def cuda_available() -> bool:
+    """Check whether PyTorch (installed with EasyOCR) can see a CUDA GPU"""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available()
+
+# Choose OCR engine: 'easyocr' (recommended), 'easyocr_openvino' (CPU-only hosts) or 'tesseract'
 OCR_ENGINE = 'easyocr'
 
-if OCR_ENGINE == 'easyocr':
-    import easyocr
-    # Initialize EasyOCR reader (will download model on first run)
-    reader = easyocr.Reader(['en'], gpu=False)
+# Run EasyOCR on the GPU when one is available (EasyOCR falls back to CPU otherwise)
+OCR_USE_GPU = True
+
+# Maximum screenshots per submission (also used as the warmup batch size)
+MAX_SCREENSHOTS = 5
+
+# Screenshots are downscaled so their longest side is at most this many pixels before OCR
+OCR_MAX_IMAGE_SIZE = 1600
+
+# Number of EasyOCR worker processes (0 = run OCR inside the bot process).
+# Each worker loads its own model, so when EasyOCR will run on a GPU that is
+# actually present, one in-process model with batched recognition is used;
+# otherwise (CPU-only hosts, or OCR_USE_GPU off) there's a worker per two cores.
+OCR_WORKERS = (
+    0 if OCR_USE_GPU and OCR_ENGINE == 'easyocr' and cuda_available()
+    else max(1, (os.cpu_count() or 2) // 2)
+)
+
+# Most Tesseract OCR calls running at once, across all submissions (one core is left
+# for the bot itself)
+OCR_THREADS = max(1, (os.cpu_count() or 2) - 1)
+
+# OCR text of this many recently read screenshots is kept, so re-submitting
+# the same screenshot skips OCR
+OCR_CACHE_SIZE = 64
+
+USE_EASYOCR = OCR_ENGINE in ('easyocr', 'easyocr_openvino')
+USE_OCR_POOL = USE_EASYOCR and OCR_WORKERS > 0
+
+# OCR worker pool (started when the bot runs, see RUN BOT)
+ocr_pool = None
+
+# In-process EasyOCR reader (OCR_WORKERS = 0 only)
+reader = None
+
+if USE_EASYOCR:
+    from ocr_pool import OCRPool, create_reader, warm_up_reader
+    if not USE_OCR_POOL:
+        reader = create_reader(OCR_ENGINE, OCR_USE_GPU)
+        warm_up_reader(reader, batch_size=MAX_SCREENSHOTS)
 elif OCR_ENGINE == 'tesseract':
-    import pytesseract
-    # Uncomment and set path if Tesseract not in PATH (Windows example):
-    # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+    # Screenshots are OCR'd in parallel, one Tesseract instance each, which is faster
+    # than letting every instance spread itself over all cores with OpenMP
+    os.environ.setdefault('OMP_THREAD_LIMIT', '1')
+    # tesserocr (optional) keeps the model loaded in-process instead of starting
+    # the tesseract program (and reloading the model) for every screenshot
+    try:
+        from tesserocr import PyTessBaseAPI, OEM
+    except ImportError:
+        PyTessBaseAPI = None
+        import pytesseract
+        # Uncomment and set path if Tesseract not in PATH (Windows example):
+        # pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
 
 # =============================================================================
 # CONFIGURATION
@@ -66,22 +159,51 @@ GUILD_ID = discord.Object(id=1423712633919377553 )  # Replace with: discord.Obje
 WIN_BONUS = 200
 PLACEMENT_FACTOR = 20
 
-# Database file
+# Only show the top N players in leaderboard posts (None shows everyone)
+LEADERBOARD_LIMIT = None
+
+# Database backend: 'sqlite' (recommended) or 'json'
+DB_BACKEND = 'sqlite'
+
+# Database files (an existing JSON board is imported into SQLite on first run)
 DB_FILE = 'bounty_board.json'
+SQLITE_DB_FILE = 'bounty_board.db'
+
+# JSON backend: each change is appended to DB_LOG_FILE, which is folded back
+# into DB_FILE after this many entries (and on shutdown)
+DB_LOG_FILE = 'bounty_board.log'
+LOG_COMPACT_EVERY = 200
+
+# Seconds to wait before saving, so bursts of edits become a single write
+SAVE_DELAY = 0.5
+
+# Log level ('DEBUG' shows every OCR line, parse decision and merge step)
+LOG_LEVEL = 'INFO'
 
 # =============================================================================
 # BOT SETUP
 # =============================================================================
 
+logger = logging.getLogger(__name__)
+
 intents = discord.Intents.default()
 intents.message_content = True
 
-bot = commands.Bot(command_prefix='!', intents=intents)
+class BountyBot(commands.Bot):
+    async def close(self):
+        # Release pooled CDN connections before the event loop goes away
+        await close_http_session()
+        await super().close()
+
+bot = BountyBot(command_prefix='!', intents=intents)
 
 # =============================================================================
 # OCR ERROR CORRECTION FUNCTIONS
 # =============================================================================
 
+# Character map for common OCR misreads (applied after lowercasing)
+_OCR_TRANS = str.maketrans({'l': 'i', '1': 'i', '0': 'o', '5': 's'})
+
 def normalize_ocr_text(text: str) -> str:
     """
     Normalize text to handle common OCR errors.
@@ -98,45 +220,9 @@ def normalize_ocr_text(text: str) -> str:
     Returns:
         Normalized text for fuzzy matching
     """
-    text = text.lower()
-    
-    # Replace common OCR misreads
-    text = re.sub(r'[l1]', 'i', text)
-    text = re.sub(r'0', 'o', text)
-    text = re.sub(r'5', 's', text)
-    
-    return text
-
-
-def fuzzy_match_keyword(text: str, keyword: str) -> bool:
-    """
-    Check if a keyword appears in text, accounting for OCR errors.
-    
-    Args:
-        text: The text to search in (e.g., "Tlme" or "Time")
-        keyword: The keyword to find (e.g., "time")
-    
-    Returns:
-        True if keyword found (with OCR tolerance)
-    """
-    normalized_text = normalize_ocr_text(text)
-    normalized_keyword = normalize_ocr_text(keyword)
-    
-    return normalized_keyword in normalized_text
-
-
-def fuzzy_match_any(text: str, keywords: list) -> bool:
-    """
-    Check if any keyword from a list appears in text.
-    
-    Args:
-        text: The text to search in
-        keywords: List of keywords to search for
-    
-    Returns:
-        True if any keyword is found
-    """
-    return any(fuzzy_match_keyword(text, kw) for kw in keywords)
+    # Lowercase, then replace common OCR misreads in a single pass
+    # (parsed names are ASCII-only, so casefold() would change nothing)
+    return text.lower().translate(_OCR_TRANS)
 
 
 # =============================================================================
@@ -154,71 +240,388 @@ def merge_screenshot_data(parsed_data_list: List[Dict]) -> Dict:
     if len(parsed_data_list) == 1:
         return parsed_data_list[0]
     
-    print("\n=== MERGING SCREENSHOTS ===")
+    logger.debug("=== MERGING SCREENSHOTS ===")
     
     # Start with first screenshot
-    merged_results = list(parsed_data_list[0]['results'])  # [(name, position), ...]
-    current_max_position = len(merged_results)
+    merged_names = list(parsed_data_list[0]['names'])
+    merged_positions = list(parsed_data_list[0]['positions'])
+    current_max_position = len(merged_names)
+    
+    # Hash join on normalized names: each name is normalized once and checked
+    # against this set, so merging is linear in the total number of players
+    # (OCR-ambiguous spellings like Al1ce/Alice and case variants collapse)
+    existing_names = {normalize_ocr_text(name) for name in merged_names}
     
-    print(f"Screenshot 1: {len(merged_results)} players (positions 1-{current_max_position})")
+    logger.debug("Screenshot 1: %d players (positions 1-%d)", len(merged_names), current_max_position)
     
     # Process subsequent screenshots
     for idx, parsed_data in enumerate(parsed_data_list[1:], 2):
-        new_results = parsed_data['results']
+        new_names = parsed_data['names']
         
-        print(f"\nScreenshot {idx}: {len(new_results)} players")
+        logger.debug("Screenshot %d: %d players", idx, len(new_names))
         
         # Find overlapping players (players that appear in both)
-        existing_names = {name.lower() for name, _ in merged_results}
         overlap_count = 0
         new_players_added = 0
         
-        for player_name, original_position in new_results:
-            player_lower = player_name.lower()
+        for player_name in new_names:
+            player_key = normalize_ocr_text(player_name)
             
-            if player_lower in existing_names:
+            if player_key in existing_names:
                 # This is an overlapping player - skip
                 overlap_count += 1
-                print(f"   Overlap: {player_name} (already in results)")
+                logger.debug("   Overlap: %s (already in results)", player_name)
             else:
                 # New player - add with next position
                 current_max_position += 1
-                merged_results.append((player_name, current_max_position))
-                existing_names.add(player_lower)
+                merged_names.append(player_name)
+                merged_positions.append(current_max_position)
+                existing_names.add(player_key)
                 new_players_added += 1
-                print(f"   Added: {player_name} at position {current_max_position}")
+                logger.debug("   Added: %s at position %d", player_name, current_max_position)
         
-        print(f"Screenshot {idx} summary: {overlap_count} overlaps, {new_players_added} new players added")
+        logger.debug("Screenshot %d summary: %d overlaps, %d new players added", idx, overlap_count, new_players_added)
     
-    print(f"\n✅ Merge complete: {len(merged_results)} total unique players")
+    logger.debug("✅ Merge complete: %d total unique players", len(merged_names))
     
     return {
-        'total_players': len(merged_results),
-        'results': merged_results
+        'total_players': len(merged_names),
+        'names': merged_names,
+        'positions': merged_positions
     }
 
 # =============================================================================
 # DATABASE FUNCTIONS
 # =============================================================================
 
+# SQLite connection (sqlite backend only)
+db_conn = None
+
+# Changes appended to DB_LOG_FILE since DB_FILE was last written (json backend only)
+_log_entries = 0
+
+# While DB_FILE is rewritten in the background, the log it folds in is moved here
+# so changes made meanwhile start a fresh DB_LOG_FILE (json backend only)
+_COMPACTING_LOG_FILE = DB_LOG_FILE + '.compacting'
+
 def load_bounty_board() -> Dict[str, int]:
-    """Load bounty board from JSON file"""
+    """Load bounty board from the configured database"""
+    global db_conn, _board_dirty, _log_entries
+    if DB_BACKEND == 'sqlite':
+        db_conn = bounty_db.connect(SQLITE_DB_FILE)
+        board = bounty_db.load_board(db_conn)
+        json_files = [f for f in (DB_FILE, _COMPACTING_LOG_FILE, DB_LOG_FILE) if os.path.exists(f)]
+        if not board and json_files:
+            # One-time migration from the JSON board (a board that was never
+            # compacted may only exist as a change log)
+            board = load_json_bounty_board()
+            bounty_db.apply_changes(db_conn, board)
+            for json_file in json_files:
+                os.replace(json_file, json_file + '.migrated')
+            # The replayed log now lives in SQLite; don't write a new JSON board at shutdown
+            _board_dirty = False
+            _log_entries = 0
+            print(f"Imported {len(board)} players from {', '.join(json_files)} into {SQLITE_DB_FILE}")
+        return board
+    return load_json_bounty_board()
+
+def json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes (with orjson when installed; same output either way)"""
+    if orjson:
+        return orjson.dumps(obj)
+    # Raw UTF-8 like orjson, rather than json's default \u escapes for non-ASCII names
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+def json_loads(data: bytes):
+    """Parse JSON bytes (with orjson when installed; both raise json.JSONDecodeError)"""
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def load_json_bounty_board() -> Dict[str, int]:
+    """Load bounty board from JSON file, then replay changes logged since it was saved"""
+    global _board_dirty, _log_entries
+    board = {}
     if os.path.exists(DB_FILE):
         try:
-            with open(DB_FILE, 'r') as f:
-                return json.load(f)
+            with open(DB_FILE, 'rb') as f:
+                board = json_loads(f.read())
         except json.JSONDecodeError:
             print(f"Warning: Could not read {DB_FILE}, starting fresh")
-    return {}
+    
+    # An interrupted compaction leaves older changes in _COMPACTING_LOG_FILE
+    _log_entries = replay_bounty_log(board, _COMPACTING_LOG_FILE) + replay_bounty_log(board, DB_LOG_FILE)
+    if _log_entries:
+        # Fold the replayed log into the JSON file at the next save
+        _board_dirty = True
+    return board
+
+def replay_bounty_log(board: Dict[str, int], log_file: str) -> int:
+    """
+    Apply the changes recorded in a change log to a freshly loaded board.
+    
+    Entries hold absolute bounties, so replaying a log that was already
+    folded into the JSON file is harmless.
+    
+    Returns:
+        Number of log entries applied
+    """
+    if not os.path.exists(log_file):
+        return 0
+    
+    applied = 0
+    with open(log_file, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                change = json_loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write can leave a partial last line
+                print(f"Warning: Ignoring unreadable entry in {log_file}")
+                break
+            
+            if change.get('reset'):
+                board.clear()
+            for name in change.get('removed', ()):
+                board.pop(name, None)
+            board.update(change.get('updated', {}))
+            applied += 1
+    return applied
+
+def append_bounty_log(updated: Dict[str, int], removed: Iterable[str] = (), reset: bool = False):
+    """Append one change to DB_LOG_FILE, compacting it into DB_FILE once it grows long"""
+    global _board_dirty, _log_entries
+    change = {'reset': reset, 'removed': list(removed), 'updated': updated}
+    with open(DB_LOG_FILE, 'ab') as f:
+        f.write(json_dumps(change) + b'\n')
+    
+    _log_entries += 1
+    _board_dirty = True  # the JSON file is behind until the log is compacted
+    if _log_entries >= LOG_COMPACT_EVERY:
+        schedule_save()
 
 def save_bounty_board(board: Dict[str, int]):
-    """Save bounty board to JSON file"""
-    with open(DB_FILE, 'w') as f:
-        json.dump(board, f, indent=2)
+    """Save bounty board to JSON file (written to a temp file, then swapped in)"""
+    tmp_file = DB_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(json_dumps(board))
+    os.replace(tmp_file, DB_FILE)
+
+def discard_bounty_logs():
+    """Delete the change logs once DB_FILE holds everything they recorded"""
+    for log_file in (_COMPACTING_LOG_FILE, DB_LOG_FILE):
+        if os.path.exists(log_file):
+            os.remove(log_file)
+
+def rotate_bounty_log():
+    """Move DB_LOG_FILE aside for a background compaction, so new changes start a fresh log"""
+    if not os.path.exists(DB_LOG_FILE):
+        return
+    if os.path.exists(_COMPACTING_LOG_FILE):
+        # An earlier background write failed: keep its entries ahead of the newer ones
+        with open(DB_LOG_FILE, 'rb') as src, open(_COMPACTING_LOG_FILE, 'ab') as dst:
+            dst.write(src.read())
+        os.remove(DB_LOG_FILE)
+    else:
+        os.replace(DB_LOG_FILE, _COMPACTING_LOG_FILE)
+
+# Debounced saving state: one background task writes the board whenever
+# _save_requested is set, so a burst of edits becomes a single write
+_board_dirty = False
+_save_requested: Optional[asyncio.Event] = None
+_save_task: Optional[asyncio.Task] = None
+
+async def _background_saver():
+    """Wait for save requests, let edits settle, then write the board off the event loop"""
+    while True:
+        await _save_requested.wait()
+        await asyncio.sleep(SAVE_DELAY)
+        _save_requested.clear()
+        await write_pending_save()
+
+async def write_pending_save():
+    """Write the bounty board in a worker thread if it has unsaved changes"""
+    global _board_dirty, _log_entries
+    if not _board_dirty:
+        return
+    
+    # Snapshot and rotate on the event loop, so edits made during the write
+    # land in the fresh log and the next save
+    _board_dirty = False
+    board = dict(bounty_board)
+    rotate_bounty_log()
+    _log_entries = 0
+    try:
+        await asyncio.to_thread(save_bounty_board, board)
+    except OSError as e:
+        # The rotated log still holds these changes; try again on the next save
+        print(f"❌ Failed to save {DB_FILE}: {e}")
+        _board_dirty = True
+        return
+    if os.path.exists(_COMPACTING_LOG_FILE):
+        os.remove(_COMPACTING_LOG_FILE)
+
+def schedule_save():
+    """Mark the bounty board as changed and save it shortly"""
+    global _board_dirty, _save_requested, _save_task
+    _board_dirty = True
+    
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # No event loop running - save right away
+        flush_pending_save()
+        return
+    
+    if _save_task is None or _save_task.done():
+        _save_requested = asyncio.Event()
+        _save_task = loop.create_task(_background_saver())
+    _save_requested.set()
+
+def flush_pending_save():
+    """Write the bounty board now if it has unsaved changes, then delete the change logs"""
+    global _board_dirty, _log_entries
+    if _board_dirty:
+        _board_dirty = False
+        save_bounty_board(bounty_board)
+        _log_entries = 0
+        discard_bounty_logs()
+
+def save_bounty_changes(updated: List[str] = (), removed: List[str] = (), reset: bool = False):
+    """
+    Persist changes already made to the in-memory bounty board.
+    
+    Either way only the change itself is written: SQLite updates the
+    affected rows in one transaction, and the JSON backend appends it to
+    the change log.
+    
+    Args:
+        updated: Players whose bounty was added or changed
+        removed: Players deleted from the board
+        reset: The whole board was cleared
+    """
+    changed = {name: bounty_board[name] for name in updated}
+    if DB_BACKEND == 'sqlite':
+        bounty_db.apply_changes(db_conn, changed, removed, reset)
+    else:
+        append_bounty_log(changed, removed, reset)
+
+class _BisectSortedList(list):
+    """Minimal stand-in for sortedcontainers.SortedList (O(N) inserts, but never re-sorts)"""
+    
+    def __init__(self, iterable=()):
+        super().__init__(sorted(iterable))
+    
+    def add(self, item):
+        bisect.insort(self, item)
+    
+    def remove(self, item):
+        del self[bisect.bisect_left(self, item)]
 
 # Initialize bounty board
 bounty_board = load_bounty_board()
 
+# Leaderboard order kept in sync with bounty_board as (-bounty, name) entries,
+# so iterating it yields the highest bounty first without re-sorting
+sorted_board = (SortedList or _BisectSortedList)((-bounty, name) for name, bounty in bounty_board.items())
+
+# Signed display string for each bounty (e.g. "+120"), refreshed only when a bounty changes
+bounty_board_fmt = {name: f"{bounty:+}" for name, bounty in bounty_board.items()}
+
+# Case-insensitive lookup: casefolded name -> names as stored, oldest first
+bounty_board_ci: Dict[str, List[str]] = {}
+for _name in bounty_board:
+    bounty_board_ci.setdefault(_name.casefold(), []).append(_name)
+
+# Bumped on every board change, so cached leaderboard text knows when it is stale
+board_version = 0
+
+def set_bounty(name: str, bounty: int):
+    """Set a player's bounty, keeping the sorted leaderboard in sync"""
+    global board_version
+    board_version += 1
+    old = bounty_board.get(name)
+    if old is not None:
+        sorted_board.remove((-old, name))
+    else:
+        bounty_board_ci.setdefault(name.casefold(), []).append(name)
+    bounty_board[name] = bounty
+    sorted_board.add((-bounty, name))
+    bounty_board_fmt[name] = f"{bounty:+}"
+
+# Sentinel for "player not on the board" (a bounty can legitimately be 0)
+_MISSING = object()
+
+def delete_bounty(name: str) -> Optional[int]:
+    """Remove a player from the board and return their bounty, or None if they weren't on it"""
+    global board_version
+    bounty = bounty_board.pop(name, _MISSING)
+    if bounty is _MISSING:
+        return None
+    board_version += 1
+    sorted_board.remove((-bounty, name))
+    _forget_name(name)
+    return bounty
+
+def delete_bounties(names: Iterable[str]) -> Dict[str, int]:
+    """
+    Remove several players from the board at once.
+    
+    The board version is bumped once, and without sortedcontainers the
+    sorted leaderboard is filtered in one pass instead of one list removal
+    per player.
+    
+    Returns:
+        The bounty of each player that was on the board, in the order given
+    """
+    global board_version
+    removed = {}
+    for name in names:
+        bounty = bounty_board.pop(name, _MISSING)
+        if bounty is not _MISSING:
+            removed[name] = bounty
+    if not removed:
+        return removed
+    
+    board_version += 1
+    if SortedList is not None:
+        for name, bounty in removed.items():
+            sorted_board.remove((-bounty, name))
+    else:
+        sorted_board[:] = [entry for entry in sorted_board if entry[1] not in removed]
+    for name in removed:
+        _forget_name(name)
+    return removed
+
+def _forget_name(name: str):
+    """Drop a deleted player's formatted bounty and case-insensitive lookup entry"""
+    del bounty_board_fmt[name]
+    key = name.casefold()
+    spellings = bounty_board_ci[key]
+    spellings.remove(name)
+    if not spellings:
+        del bounty_board_ci[key]
+
+def clear_bounties():
+    """Remove every player from the board"""
+    global board_version
+    board_version += 1
+    bounty_board.clear()
+    sorted_board.clear()
+    bounty_board_fmt.clear()
+    bounty_board_ci.clear()
+
+def find_player(name: str) -> Optional[str]:
+    """Return the board's spelling of a player name (exact match first, then ignoring case)"""
+    if name in bounty_board:
+        return name
+    spellings = bounty_board_ci.get(name.casefold())
+    return spellings[0] if spellings else None
+
+def iter_leaderboard(limit: Optional[int] = None):
+    """Yield (name, bounty) pairs from the highest bounty down, stopping after limit players"""
+    for neg_bounty, name in itertools.islice(sorted_board, limit):
+        yield name, -neg_bounty
+
 # Store last game data for editing
 last_game_data = None
 
@@ -226,49 +629,294 @@ last_game_data = None
 # OCR FUNCTIONS
 # =============================================================================
 
-async def download_image_from_attachment(attachment: discord.Attachment) -> Optional[Image.Image]:
-    """Download image from Discord attachment and return PIL Image"""
+# Shared HTTP session for screenshot downloads (created on first use, see get_http_session)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared download session, creating it inside the running event loop"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        # Keep connections to the CDN alive between submissions, and enough of them
+        # for every screenshot of a submission to download at once
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+        )
+    return _http_session
+
+async def close_http_session():
+    """Close the shared download session (called when the bot shuts down)"""
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+
+# Screenshot file extensions accepted when Discord doesn't report an image content type
+IMAGE_EXTENSIONS = frozenset(['png', 'jpg', 'jpeg', 'gif', 'bmp', 'webp'])
+
+def is_image_attachment(attachment: discord.Attachment) -> bool:
+    """Check whether an attachment is an image, by Discord's content type or else its file extension"""
+    if attachment.content_type and attachment.content_type.startswith('image/'):
+        return True
+    _, dot, extension = attachment.filename.rpartition('.')
+    return bool(dot) and extension.lower() in IMAGE_EXTENSIONS
+
+async def download_attachment(attachment: discord.Attachment) -> Optional[bytes]:
+    """Download a Discord attachment's bytes (None if the download failed)"""
     try:
-        data = await attachment.read()
-        return Image.open(BytesIO(data))
+        async with get_http_session().get(attachment.url) as response:
+            response.raise_for_status()
+            return await response.read()
     except Exception as e:
         print(f"Error downloading image: {e}")
     return None
 
-def perform_ocr(image: Image.Image) -> str:
-    """Perform OCR on image and return extracted text"""
+async def load_screenshot(data: bytes) -> Optional[Image.Image]:
+    """Decode a downloaded screenshot in a thread (decoding would stall the event loop)"""
+    try:
+        return await asyncio.to_thread(decode_screenshot, data)
+    except Exception as e:
+        print(f"Error decoding image: {e}")
+    return None
+
+def decode_screenshot(data: bytes) -> Image.Image:
+    """Decode downloaded screenshot bytes, downscaled for OCR"""
+    image = Image.open(BytesIO(data))
+    # JPEGs can decode straight at reduced scale; other formats ignore this
+    image.draft('RGB', (OCR_MAX_IMAGE_SIZE, OCR_MAX_IMAGE_SIZE))
+    # Text stays readable at this size and OCR cost scales with pixel count
+    image.thumbnail((OCR_MAX_IMAGE_SIZE, OCR_MAX_IMAGE_SIZE), Image.BILINEAR)
+    image.load()
+    return image
+
+def image_to_array(image: Image.Image) -> np.ndarray:
+    """Convert a PIL Image to an RGB numpy array for EasyOCR"""
+    if image.mode != 'RGB':
+        image = image.convert('RGB')
+    # asarray avoids the extra copy np.array would make
+    return np.asarray(image)
+
+def prepare_for_tesseract(image: Image.Image) -> Image.Image:
+    """
+    Convert a screenshot to high-contrast grayscale for Tesseract.
+    
+    Tesseract binarizes internally anyway, so a single channel is a third of
+    the pixels to push through, and stretching the contrast helps with the
+    P0ints/Polnts style misreads on faint text.
+    """
+    return ImageOps.autocontrast(image.convert('L'), cutoff=2)
+
+# One tesserocr API per Tesseract thread (an API object must not be used from two
+# threads at once); only the OCR_THREADS threads of tesseract_ocr's executor use them
+_tess_local = threading.local()
+
+def tesseract_to_string(image: Image.Image) -> str:
+    """OCR one screenshot with Tesseract, through this thread's persistent tesserocr API when available"""
+    image = prepare_for_tesseract(image)
+    if PyTessBaseAPI is None:
+        return pytesseract.image_to_string(image)
+    
+    api = getattr(_tess_local, 'api', None)
+    if api is None:
+        api = _tess_local.api = PyTessBaseAPI(lang='eng', oem=OEM.LSTM_ONLY)
+    api.SetImage(image)
+    return api.GetUTF8Text()
+
+def perform_ocr_batch(images: List[Image.Image]) -> List[str]:
+    """
+    Perform OCR on several images in one pass and return the extracted text for each.
+    
+    With EasyOCR all images go through a single batched detection/recognition
+    pass, resized to a common size, instead of one pass per screenshot.
+    """
+    if not images:
+        return []
     try:
-        if OCR_ENGINE == 'easyocr':
-            # Convert PIL Image to numpy array for EasyOCR
-            image_array = np.array(image)
-            # EasyOCR returns list of (bbox, text, confidence)
-            results = reader.readtext(image_array)
-            text = '\n'.join([result[1] for result in results])
+        if USE_EASYOCR:
+            # Convert PIL Images to numpy arrays for EasyOCR
+            image_arrays = [image_to_array(image) for image in images]
+            height = max(array.shape[0] for array in image_arrays)
+            width = max(array.shape[1] for array in image_arrays)
+            # EasyOCR returns one list of (bbox, text, confidence) per image
+            batch_results = reader.readtext_batched(
+                image_arrays, n_width=width, n_height=height, batch_size=len(image_arrays)
+            )
+            return ['\n'.join([result[1] for result in results]) for results in batch_results]
         else:  # tesseract
-            text = pytesseract.image_to_string(image)
-        return text
+            return [tesseract_to_string(image) for image in images]
     except Exception as e:
         print(f"OCR Error: {e}")
-        return ""
+        return [""] * len(images)
+
+def perform_ocr(image: Image.Image) -> str:
+    """Perform OCR on image and return extracted text"""
+    return perform_ocr_batch([image])[0]
+
+def pool_ocr(image: Image.Image) -> str:
+    """OCR one screenshot in the worker pool, blocking until its text is ready"""
+    return ocr_pool.submit_and_wait(image_to_array(image))
+
+# Dedicated Tesseract threads (created on first use). A fixed set of OCR_THREADS
+# threads both caps concurrent calls and bounds how many tesserocr APIs, each with
+# its own copy of the model, ever get loaded - asyncio's shared default executor
+# could spread calls over dozens of threads.
+_tesseract_executor: Optional[ThreadPoolExecutor] = None
+
+async def tesseract_ocr(image: Image.Image) -> str:
+    """OCR one screenshot with Tesseract on one of the OCR_THREADS Tesseract threads"""
+    global _tesseract_executor
+    if _tesseract_executor is None:
+        _tesseract_executor = ThreadPoolExecutor(max_workers=OCR_THREADS, thread_name_prefix='tesseract')
+    return await asyncio.get_running_loop().run_in_executor(_tesseract_executor, perform_ocr, image)
+
+# Single thread for the in-process EasyOCR reader (created on first use). The
+# reader isn't thread-safe, so overlapping submissions queue up here instead of
+# running it from several default-executor threads at once.
+_easyocr_executor: Optional[ThreadPoolExecutor] = None
+
+async def easyocr_batch(images: List[Image.Image]) -> List[str]:
+    """OCR screenshots with the in-process EasyOCR reader, one batch at a time"""
+    global _easyocr_executor
+    if _easyocr_executor is None:
+        _easyocr_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='easyocr')
+    return await asyncio.get_running_loop().run_in_executor(_easyocr_executor, perform_ocr_batch, images)
+
+# OCR text by SHA-1 of the screenshot bytes, least recently used first
+_ocr_text_cache: "OrderedDict[str, str]" = OrderedDict()
+
+async def read_screenshots(screenshots: List[bytes]) -> List[str]:
+    """
+    Get the OCR text of downloaded screenshots, only decoding and OCRing the
+    ones not read recently (admins often re-submit the same screenshot).
+    """
+    digests = [hashlib.sha1(data).hexdigest() for data in screenshots]
+    texts = [_ocr_text_cache.get(digest) for digest in digests]
+    for digest, text in zip(digests, texts):
+        if text is not None:
+            _ocr_text_cache.move_to_end(digest)
+    
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if not missing:
+        return texts
+    
+    images = await asyncio.gather(*[load_screenshot(screenshots[i]) for i in missing])
+    readable = [(i, image) for i, image in zip(missing, images) if image is not None]
+    ocr_texts = await ocr_images([image for _, image in readable])
+    for i in missing:
+        texts[i] = ""
+    for (i, _), text in zip(readable, ocr_texts):
+        texts[i] = text
+        if text:
+            _ocr_text_cache[digests[i]] = text
+            if len(_ocr_text_cache) > OCR_CACHE_SIZE:
+                _ocr_text_cache.popitem(last=False)
+    return texts
+
+async def ocr_images(images: List[Image.Image]) -> List[str]:
+    """OCR several screenshots without blocking the event loop, using the best path for the engine"""
+    if ocr_pool:
+        # Worker processes OCR the screenshots in parallel while the event loop stays responsive
+        # (the pool's worker count already bounds how many run at once)
+        return await asyncio.gather(*[asyncio.to_thread(pool_ocr, image) for image in images])
+    if USE_EASYOCR:
+        if reader is None:
+            # perform_ocr_batch would swallow the error and report every screenshot as unreadable
+            raise RuntimeError("EasyOCR is not ready: the OCR worker pool is started by running "
+                               "this script directly (see RUN BOT), or set OCR_WORKERS = 0")
+        # One batched pass off the event loop, on the reader's own thread
+        return await easyocr_batch(images)
+    # Each Tesseract call has its own process or API instance, so OCR screenshots side by
+    # side, but no more than there are cores for even when several submissions overlap
+    return await asyncio.gather(*[tesseract_ocr(image) for image in images])
 
 # =============================================================================
 # PARSING FUNCTIONS
 # =============================================================================
 
+# Names made only of these characters need no stripping
+_PLAIN_NAME_CHARS = frozenset(string.ascii_letters + string.digits + '_ -')
+_NAME_STRIP_RE = re.compile(r'[^\w\s-]')
+
 def clean_player_name(name: str) -> str:
     """Clean and normalize player names"""
-    # Remove special characters, extra spaces
-    name = re.sub(r'[^\w\s-]', '', name)
+    # Remove special characters (regex only needed for unusual names), extra spaces
+    if not _PLAIN_NAME_CHARS.issuperset(name):
+        name = _NAME_STRIP_RE.sub('', name)
     name = ' '.join(name.split())
     return name.strip()
 
+# Keywords that mark the results table header
+HEADER_LINE_KEYWORDS = ['place', 'player']
+
+# Minimum rapidfuzz partial_ratio for a typo'd header keyword to count
+HEADER_FUZZY_THRESHOLD = 80
+
+# Header keywords to skip
+HEADER_KEYWORDS = ['place', 'player', 'time', 'points', 'damage',
+                   'wins', 'races', 'elimination', 'name']
+
+# Specific words to ignore (OCR artifacts/misreads)
+IGNORE_WORDS = ['even', 'dltc', 'def', 'juaz', 'dne']
+
+# Placement indicators that precede player names
+PLACEMENT_TOKENS = frozenset(['1ST', '2ND', '3RD', 'DNF', 'IST'])
+
+# Precompiled token patterns used by the parser
+_CLEAN_TOKEN_RE = re.compile(r'[^\w_]')
+_USERNAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+_USERNAME_FINDALL_RE = re.compile(r'[A-Za-z][A-Za-z0-9_]{2,}')
+_LETTER_RE = re.compile(r'[A-Za-z]')
+
+# Normalized once at startup instead of on every comparison
+_NORMALIZED_HEADER_LINE_KEYWORDS = [normalize_ocr_text(kw) for kw in HEADER_LINE_KEYWORDS]
+_NORMALIZED_HEADER_KEYWORDS = [normalize_ocr_text(kw) for kw in HEADER_KEYWORDS]
+_NORMALIZED_IGNORE_WORDS = frozenset(normalize_ocr_text(word) for word in IGNORE_WORDS)
+
+# Each keyword list fused into one alternation, so a line or token is scanned
+# once instead of once per keyword
+_HEADER_LINE_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _NORMALIZED_HEADER_LINE_KEYWORDS)))
+_HEADER_KEYWORDS_RE = re.compile('|'.join(map(re.escape, _NORMALIZED_HEADER_KEYWORDS)))
+
+def is_header_line(line: str, normalized_line: str) -> bool:
+    """
+    Check if a line is the results table header (e.g. "Place Player Time").
+    
+    Any header keyword found in normalized_line (the line passed through
+    normalize_ocr_text) counts. With rapidfuzz installed, a line where every
+    header keyword nearly matches a different word (e.g. "Plce Plyer" or
+    "Plaee Pl4yer") also counts. Words without letters (positions, times)
+    are left out, so a player row only offers its name, and names like
+    "7 Lance_Payer 1:00" or "9 SpaceyLayer 1:22" aren't taken for the header.
+    """
+    if _HEADER_LINE_KEYWORDS_RE.search(normalized_line):
+        return True
+    
+    if fuzz is None:
+        return False
+    
+    # normalize_ocr_text maps characters one to one, so the words line up
+    unmatched_words = [
+        normalized_word
+        for word, normalized_word in zip(line.split(), normalized_line.split())
+        if _LETTER_RE.search(word)
+    ]
+    for kw in _NORMALIZED_HEADER_LINE_KEYWORDS:
+        match = next(
+            (word for word in unmatched_words
+             if fuzz.ratio(kw, word, score_cutoff=HEADER_FUZZY_THRESHOLD)),
+            None
+        )
+        if match is None:
+            return False
+        unmatched_words.remove(match)
+    return True
+
 def parse_marbles_screenshot(text: str) -> Optional[Dict[str, any]]:
     """
     Parse OCR text to extract player data from Marbles on Stream.
     Position-based ranking only.
     """
     lines = text.split('\n')
-    results = []
+    names = []
+    positions = []
+    seen_names = set()  # lowercased names already found
 
     # Clean and filter lines
     clean_lines = []
@@ -277,32 +925,29 @@ def parse_marbles_screenshot(text: str) -> Optional[Dict[str, any]]:
         if line and len(line) > 2:
             clean_lines.append(line)
 
-    print(f"Processing {len(clean_lines)} lines")
-    print("Raw OCR text:")
-    for i, line in enumerate(clean_lines[:50]):  # print first 50 lines for debugging
-        print(f"   {i}: {line}")
+    logger.debug("Processing %d lines", len(clean_lines))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Raw OCR text:")
+        for i, line in enumerate(clean_lines[:50]):  # log first 50 lines for debugging
+            logger.debug("   %d: %s", i, line)
 
     # Parse each line looking for player data
     position = 0
     header_found = False
 
-    # Header keywords to skip
-    header_keywords = ['place', 'player', 'time', 'points', 'damage',
-                       'wins', 'races', 'elimination', 'name']
-
-    # Specific words to ignore (OCR artifacts/misreads)
-    ignore_words = ['even', 'dltc', 'def', 'juaz','dne']
-
     for line_idx, line in enumerate(clean_lines):
+        # Normalize once for all the checks on this line
+        normalized_line = normalize_ocr_text(line)
+
         # Detect header line using fuzzy matching
-        if fuzzy_match_any(line, ['place', 'player']):
+        if is_header_line(line, normalized_line):
             header_found = True
-            print(f"Header detected at line {line_idx}: {line}")
+            logger.debug("Header detected at line %d: %s", line_idx, line)
             continue
 
         # Skip lines that are purely header remnants
-        if fuzzy_match_any(line, header_keywords) and not any(c.isdigit() for c in line):
-            print(f"Skipping header remnant: {line}")
+        if _HEADER_KEYWORDS_RE.search(normalized_line) and not any(c.isdigit() for c in line):
+            logger.debug("Skipping header remnant: %s", line)
             continue
 
         tokens = line.split()
@@ -310,69 +955,87 @@ def parse_marbles_screenshot(text: str) -> Optional[Dict[str, any]]:
 
         # Find the player name
         for i, token in enumerate(tokens):
-            token_clean = re.sub(r'[^\w_]', '', token)
+            token_clean = _CLEAN_TOKEN_RE.sub('', token)
 
             # Skip placement indicators
-            if token.upper() in ['1ST', '2ND', '3RD', 'DNF', 'IST']:
+            if token.upper() in PLACEMENT_TOKENS:
                 continue
 
+            normalized_token = normalize_ocr_text(token_clean)
+
             # Skip if it matches common header words
-            if fuzzy_match_any(token_clean, header_keywords):
+            if _HEADER_KEYWORDS_RE.search(normalized_token):
                 continue
 
             # Skip specific ignore words
-            if token_clean.lower() in ignore_words:
-                print(f"Skipping ignore word: {token_clean}")
+            if normalized_token in _NORMALIZED_IGNORE_WORDS:
+                logger.debug("Skipping ignore word: %s", token_clean)
                 continue
 
             # Check if this looks like a username
-            if re.match(r'^[A-Za-z][A-Za-z0-9_]*$', token_clean) and len(token_clean) >= 3:
+            if _USERNAME_RE.match(token_clean) and len(token_clean) >= 3:
                 player_name = clean_player_name(token_clean)
                 break
 
         # If we found a player name, add them
         if player_name and len(player_name) >= 3:
-            if not any(p[0].lower() == player_name.lower() for p in results):
+            player_lower = player_name.lower()
+            if player_lower not in seen_names:
                 position += 1
-                results.append((player_name, position))
-                print(f"✓ Position {position}: {player_name}")
+                names.append(player_name)
+                positions.append(position)
+                seen_names.add(player_lower)
+                logger.debug("✓ Position %d: %s", position, player_name)
 
     # Fallback: aggressive parsing if we found very few results
-    if len(results) < 2:
-        print("Standard parsing found few results, trying aggressive mode...")
-        results = []
+    if len(names) < 2:
+        logger.debug("Standard parsing found few results, trying aggressive mode...")
+        names = []
+        positions = []
+        seen_names = set()
         position = 0
 
         for line in clean_lines:
-            if fuzzy_match_any(line, ['place', 'player']):
+            # Lines without any letters (times, scores, punctuation) can't hold a
+            # name or be the header, so skip them before any normalizing
+            if not _LETTER_RE.search(line):
                 continue
 
-            potential_names = re.findall(r'[A-Za-z][A-Za-z0-9_]{2,}', line)
+            if is_header_line(line, normalize_ocr_text(line)):
+                continue
+
+            potential_names = _USERNAME_FINDALL_RE.findall(line)
 
             for name in potential_names:
-                if fuzzy_match_any(name, header_keywords):
+                normalized_name = normalize_ocr_text(name)
+
+                if _HEADER_KEYWORDS_RE.search(normalized_name):
                     continue
 
                 # Skip ignore words in aggressive mode too
-                if name.lower() in ignore_words:
+                if normalized_name in _NORMALIZED_IGNORE_WORDS:
                     continue
 
-                if any(p[0].lower() == name.lower() for p in results):
+                name_lower = name.lower()
+                if name_lower in seen_names:
                     continue
 
                 position += 1
-                results.append((name, position))
-                print(f"✓ (Aggressive) Position {position}: {name}")
+                names.append(name)
+                positions.append(position)
+                seen_names.add(name_lower)
+                logger.debug("✓ (Aggressive) Position %d: %s", position, name)
                 break
 
-    if not results:
-        print("❌ No results found!")
+    if not names:
+        logger.debug("❌ No results found!")
         return None
 
-    print(f"\n✅ Successfully parsed {len(results)} players")
+    logger.debug("✅ Successfully parsed %d players", len(names))
     return {
-        'total_players': len(results),
-        'results': results
+        'total_players': len(names),
+        'names': names,
+        'positions': positions
     }
 
 # =============================================================================
@@ -402,110 +1065,160 @@ def calculate_bounty(position: int, total_players: int, is_winner: bool = False)
     
     return total_bounty
 
+def calculate_bounties(positions: np.ndarray, total_players: int) -> np.ndarray:
+    """
+    Vectorized calculate_bounty: bounties for many positions of one game at once.
+    
+    Uses the same formula (and the same truncation) as calculate_bounty.
+    """
+    placement_score = ((total_players - positions + 1) - (total_players / 2)) * PLACEMENT_FACTOR
+    win_bounty = np.where(positions == 1, WIN_BONUS, 0)
+    return win_bounty + placement_score.astype(np.int64)
+
 def update_bounty_board(parsed_data: Dict):
-    """Update global bounty board with new results"""
+    """Update global bounty board with new results (also records each player's bounty in parsed_data['bounties'])"""
     global last_game_data
     
-    # Store for potential editing
-    last_game_data = parsed_data.copy()
-    
     total_players = parsed_data['total_players']
+    names = parsed_data['names']
     
-    for player_name, position in parsed_data['results']:
-        is_winner = (position == 1)
-        bounty = calculate_bounty(position, total_players, is_winner)
-        
+    # Score every player in one vectorized pass, and keep the scores with the
+    # game so formatting and editing it later don't have to recompute them
+    positions = np.asarray(parsed_data['positions'], dtype=np.int64)
+    bounties = calculate_bounties(positions, total_players).tolist()
+    parsed_data['bounties'] = bounties
+    
+    # Store for potential editing, with (name, position) pairs in finishing order
+    # (parsing and merging already number players in order) ready for paging
+    last_game_data = parsed_data.copy()
+    last_game_data['players'] = list(zip(names, parsed_data['positions']))
+    
+    for player_name, bounty in zip(names, bounties):
         # Add to player's total bounty
-        if player_name in bounty_board:
-            bounty_board[player_name] += bounty
-        else:
-            bounty_board[player_name] = bounty
+        set_bounty(player_name, bounty_board.get(player_name, 0) + bounty)
     
-    save_bounty_board(bounty_board)
+    save_bounty_changes(updated=names)
 
 # =============================================================================
 # PLAYER EDITING VIEW (INTERACTIVE BUTTONS)
 # =============================================================================
 
+# Longest player name shown in a select option, leaving room for the rank and
+# bounty within Discord's 100 character label limit
+LABEL_NAME_MAX = 80
+
+def label_name(name: str) -> str:
+    """Shorten a player name for a select option label"""
+    return name if len(name) <= LABEL_NAME_MAX else name[:LABEL_NAME_MAX - 3] + "..."
+
 class LeaderboardEditView(View):
     """Interactive view for editing the leaderboard - remove incorrect players"""
     
     def __init__(self, removed_players: List[str] = None, page: int = 0):
         super().__init__(timeout=300)  # 5 minute timeout
         self.removed_players = removed_players or []
+        self.removed_set = set(self.removed_players)  # fast membership checks
         self.page = page
         self.players_per_page = 25
+        
+        # Components are built once and re-added as the page changes
+        self._select = Select(min_values=1)
+        self._select.callback = self.player_selected
+        self._prev_button = Button(label="◀ Previous", style=discord.ButtonStyle.secondary, row=1)
+        self._prev_button.callback = self.previous_page
+        self._next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary, row=1)
+        self._next_button.callback = self.next_page
+        self._done_button = Button(label="✅ Done - Remove Selected", style=discord.ButtonStyle.success, row=2)
+        self._done_button.callback = self.done_editing
+        self._cancel_button = Button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=2)
+        self._cancel_button.callback = self.cancel_editing
+        
+        # Rendered pages (select options, player list) by page number, valid while
+        # the board and the removal list stay the same
+        self._pages: Dict[int, Tuple[List[discord.SelectOption], str]] = {}
+        self._pages_key = None
+        
         self.update_view()
     
-    def get_sorted_leaderboard(self):
-        """Get current leaderboard sorted by bounty"""
-        return sorted(bounty_board.items(), key=lambda x: x[1], reverse=True)
-    
-    def get_available_players(self):
-        """Get players not yet marked for removal"""
-        all_players = self.get_sorted_leaderboard()
-        return [(name, bounty) for name, bounty in all_players if name not in self.removed_players]
-    
-    def get_total_pages(self):
+    def get_rendered_page(self, start_idx: int) -> Tuple[List[discord.SelectOption], str]:
+        """Get the select options and player list for the current page, rendering it on first visit"""
+        pages_key = (board_version, len(self.removed_players))
+        if pages_key != self._pages_key:
+            self._pages.clear()
+            self._pages_key = pages_key
+        
+        page = self._pages.get(self.page)
+        if page is None:
+            ranked = list(enumerate(self.get_page_players(start_idx), start=start_idx + 1))
+            options = [
+                discord.SelectOption(
+                    # Final cap: discord.py rejects labels over 100 characters
+                    label=f"#{rank} {label_name(name)} ({bounty_board_fmt[name]})"[:100],
+                    value=name,
+                    description=f"Remove this player from leaderboard"
+                )
+                for rank, (name, bounty) in ranked
+            ]
+            player_list = "\n".join(f"#{rank} {name} ({bounty_board_fmt[name]})" for rank, (name, bounty) in ranked)
+            page = self._pages[self.page] = (options, player_list)
+        return page
+    
+    def get_available_count(self):
+        """Count players not yet marked for removal (no need to walk the board)"""
+        marked_on_board = sum(1 for name in self.removed_set if name in bounty_board)
+        return len(sorted_board) - marked_on_board
+    
+    def get_page_players(self, start_idx: int):
+        """Get one page of players not yet marked for removal, straight from the sorted board"""
+        end_idx = start_idx + self.players_per_page
+        if not self.removed_set:
+            # Nothing marked yet, so the page is a plain slice
+            return [(name, -neg_bounty) for neg_bounty, name in sorted_board[start_idx:end_idx]]
+        removed_set = self.removed_set
+        available = ((name, bounty) for name, bounty in iter_leaderboard() if name not in removed_set)
+        return list(itertools.islice(available, start_idx, end_idx))
+    
+    def get_total_pages(self, available_count=None):
         """Calculate total pages needed"""
-        available = self.get_available_players()
-        return max(1, (len(available) + self.players_per_page - 1) // self.players_per_page)
+        if available_count is None:
+            available_count = self.get_available_count()
+        return max(1, (available_count + self.players_per_page - 1) // self.players_per_page)
     
-    def update_view(self):
-        """Update the view with pagination"""
+    def update_view(self, available_count=None):
+        """Update the view with pagination (reusing available_count if already computed)"""
         self.clear_items()
         
-        available_players = self.get_available_players()
-        total_pages = self.get_total_pages()
-        
-        if not available_players:
-            return
+        if available_count is None:
+            available_count = self.get_available_count()
+        total_pages = self.get_total_pages(available_count)
         
         # Calculate pagination
         start_idx = self.page * self.players_per_page
-        end_idx = start_idx + self.players_per_page
-        page_players = available_players[start_idx:end_idx]
+        options, player_list = self.get_rendered_page(start_idx)
         
-        # Create select menu for current page
-        options = []
-        for rank, (name, bounty) in enumerate(page_players, start=start_idx + 1):
-            options.append(
-                discord.SelectOption(
-                    label=f"#{rank} {name} ({bounty:+})"[:100],
-                    value=name,
-                    description=f"Remove this player from leaderboard"
-                )
-            )
+        # Shared with update_message so the page is only computed once per click
+        self._page_state = (available_count, total_pages, player_list)
+        
+        if not available_count:
+            return
         
+        # Select menu for current page
         if options:
-            select = Select(
-                placeholder=f"Page {self.page + 1}/{total_pages} - Select player(s) to remove...",
-                options=options,
-                min_values=1,
-                max_values=len(options)
-            )
-            select.callback = self.player_selected
-            self.add_item(select)
+            self._select.options = options
+            self._select.placeholder = f"Page {self.page + 1}/{total_pages} - Select player(s) to remove..."
+            self._select.max_values = len(options)
+            self.add_item(self._select)
         
         # Navigation buttons (in a row)
         if self.page > 0:
-            prev_button = Button(label="◀ Previous", style=discord.ButtonStyle.secondary, row=1)
-            prev_button.callback = self.previous_page
-            self.add_item(prev_button)
+            self.add_item(self._prev_button)
         
         if self.page < total_pages - 1:
-            next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary, row=1)
-            next_button.callback = self.next_page
-            self.add_item(next_button)
+            self.add_item(self._next_button)
         
         # Action buttons (in a new row)
-        done_button = Button(label="✅ Done - Remove Selected", style=discord.ButtonStyle.success, row=2)
-        done_button.callback = self.done_editing
-        self.add_item(done_button)
-        
-        cancel_button = Button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=2)
-        cancel_button.callback = self.cancel_editing
-        self.add_item(cancel_button)
+        self.add_item(self._done_button)
+        self.add_item(self._cancel_button)
     
     async def previous_page(self, interaction: discord.Interaction):
         """Go to previous page"""
@@ -515,57 +1228,51 @@ class LeaderboardEditView(View):
     
     async def next_page(self, interaction: discord.Interaction):
         """Go to next page"""
-        total_pages = self.get_total_pages()
-        self.page = min(total_pages - 1, self.page + 1)
-        self.update_view()
+        available_count = self.get_available_count()
+        self.page = min(self.get_total_pages(available_count) - 1, self.page + 1)
+        self.update_view(available_count)
         await self.update_message(interaction)
     
     async def update_message(self, interaction: discord.Interaction):
         """Update the message content"""
-        available_players = self.get_available_players()
-        total_players = len(self.get_sorted_leaderboard())
-        total_pages = self.get_total_pages()
-        
-        start_idx = self.page * self.players_per_page
-        end_idx = start_idx + self.players_per_page
-        page_players = available_players[start_idx:end_idx]
-        
-        player_list = "\n".join([
-            f"#{rank} {name} ({bounty:+})" 
-            for rank, (name, bounty) in enumerate(page_players, start=start_idx + 1)
-        ])
-        
-        content = f"**🛠️ Edit Leaderboard**\n\n"
-        content += f"Total Players: {total_players} | Available: {len(available_players)}\n"
-        content += f"Page {self.page + 1}/{total_pages}\n\n"
+        available_count, total_pages, player_list = self._page_state
+        total_players = len(sorted_board)
+        
+        # Collected as parts and joined once rather than grown by repeated +=
+        parts = [
+            "**🛠️ Edit Leaderboard**\n\n",
+            f"Total Players: {total_players} | Available: {available_count}\n",
+            f"Page {self.page + 1}/{total_pages}\n\n",
+        ]
         
         if self.removed_players:
             removed_list = ", ".join(self.removed_players[:10])
             if len(self.removed_players) > 10:
                 removed_list += f" +{len(self.removed_players) - 10} more"
-            content += f"**Marked for Removal ({len(self.removed_players)}):** {removed_list}\n\n"
+            parts.append(f"**Marked for Removal ({len(self.removed_players)}):** {removed_list}\n\n")
         
-        content += f"**Players on this page:**\n{player_list}\n\n"
-        content += "Select players to remove, navigate pages, or click Done:"
+        parts.append(f"**Players on this page:**\n{player_list}\n\n")
+        parts.append("Select players to remove, navigate pages, or click Done:")
         
-        await interaction.response.edit_message(content=content, view=self)
+        await interaction.response.edit_message(content="".join(parts), view=self)
     
     async def player_selected(self, interaction: discord.Interaction):
         """Handle player removal selection"""
-        selected_players = interaction.data['values']
-        
-        for player in selected_players:
-            if player not in self.removed_players:
-                self.removed_players.append(player)
+        # New picks only, deduplicated but kept in the order they were selected
+        removed_set = self.removed_set
+        new_players = [player for player in dict.fromkeys(interaction.data['values']) if player not in removed_set]
+        self.removed_players.extend(new_players)
+        removed_set.update(new_players)
         
         # Recalculate pagination (players might be removed from current page)
-        total_pages = self.get_total_pages()
+        available_count = self.get_available_count()
+        total_pages = self.get_total_pages(available_count)
         
         # Adjust page if current page is now empty
         if self.page >= total_pages and total_pages > 0:
             self.page = total_pages - 1
         
-        self.update_view()
+        self.update_view(available_count)
         await self.update_message(interaction)
     
     async def done_editing(self, interaction: discord.Interaction):
@@ -579,36 +1286,26 @@ class LeaderboardEditView(View):
         
         await interaction.response.defer()
         
-        # Remove players from bounty board
-        global bounty_board
-        removed_with_bounties = []
+        # Remove players from bounty board in one batch, saved as a single change
+        removed_bounties = delete_bounties(self.removed_players)
+        removed_with_bounties = [f"{player} ({bounty:+})" for player, bounty in removed_bounties.items()]
         
-        for player in self.removed_players:
-            if player in bounty_board:
-                bounty = bounty_board[player]
-                removed_with_bounties.append(f"{player} ({bounty:+})")
-                del bounty_board[player]
-        
-        save_bounty_board(bounty_board)
+        save_bounty_changes(removed=self.removed_players)
         
         # Send confirmation
         removed_list = "\n".join(removed_with_bounties[:20])
         if len(removed_with_bounties) > 20:
             removed_list += f"\n... and {len(removed_with_bounties) - 20} more"
         
-        await interaction.followup.send(
-            f"✅ **Leaderboard Updated!**\n\n**Removed {len(self.removed_players)} player(s):**\n{removed_list}"
-        )
-        
-        # Show updated leaderboard
-        leaderboard_messages = format_leaderboard()
-        for leaderboard_msg in leaderboard_messages:
-            await interaction.followup.send(leaderboard_msg)
+        confirmation = f"✅ **Leaderboard Updated!**\n\n**Removed {len(self.removed_players)} player(s):**\n{removed_list}"
         
-        # Clear the original message
-        await interaction.message.edit(
-            content=f"✅ Leaderboard updated! Removed {len(self.removed_players)} player(s).",
-            view=None
+        # Post the confirmation and updated leaderboard while clearing the original message
+        await asyncio.gather(
+            send_in_order(interaction.followup, itertools.chain([confirmation], format_leaderboard())),
+            interaction.message.edit(
+                content=f"✅ Leaderboard updated! Removed {len(self.removed_players)} player(s).",
+                view=None
+            )
         )
     
     async def cancel_editing(self, interaction: discord.Interaction):
@@ -626,77 +1323,100 @@ class PlayerRemovalView(View):
         super().__init__(timeout=300)  # 5 minute timeout
         self.game_data = game_data
         self.removed_players = removed_players or []
+        self.removed_set = set(self.removed_players)  # fast membership checks
         self.page = page
         self.players_per_page = 25
+        
+        # Components are built once and re-added as the page changes
+        self._select = Select(min_values=1)
+        self._select.callback = self.player_selected
+        self._prev_button = Button(label="◀ Previous", style=discord.ButtonStyle.secondary, row=1)
+        self._prev_button.callback = self.previous_page
+        self._next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary, row=1)
+        self._next_button.callback = self.next_page
+        self._done_button = Button(label="✅ Done - Recalculate Bounties", style=discord.ButtonStyle.success, row=2)
+        self._done_button.callback = self.done_editing
+        self._cancel_button = Button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=2)
+        self._cancel_button.callback = self.cancel_editing
+        
+        # Rendered pages (select options, player list) by page number, valid while
+        # the removal list stays the same
+        self._pages: Dict[int, Tuple[List[discord.SelectOption], str]] = {}
+        self._pages_removed = 0
+        
         self.update_view()
     
-    def get_available_players(self):
-        """Get players not yet removed"""
-        return [
-            (name, pos) for name, pos in self.game_data['results'] 
-            if name not in self.removed_players
-        ]
+    def get_rendered_page(self, page_players: List[Tuple[str, int]]) -> Tuple[List[discord.SelectOption], str]:
+        """Get the select options and player list for the current page, rendering it on first visit"""
+        if len(self.removed_players) != self._pages_removed:
+            self._pages.clear()
+            self._pages_removed = len(self.removed_players)
+        
+        page = self._pages.get(self.page)
+        if page is None:
+            options = [
+                discord.SelectOption(
+                    # Final cap: discord.py rejects labels over 100 characters
+                    label=f"#{pos} - {label_name(name)}"[:100],
+                    value=name,
+                    description=f"Remove this player"
+                )
+                for name, pos in page_players
+            ]
+            player_list = "\n".join(f"#{pos} - {name}" for name, pos in page_players)
+            page = self._pages[self.page] = (options, player_list)
+        return page
     
-    def get_total_pages(self):
+    def get_available_players(self):
+        """Get players not yet removed (in finishing order; don't modify the returned list)"""
+        all_players = self.game_data['players']
+        if not self.removed_set:
+            return all_players  # nothing removed yet, so no need to filter
+        removed_set = self.removed_set
+        return [(name, pos) for name, pos in all_players if name not in removed_set]
+    
+    def get_total_pages(self, available_players=None):
         """Calculate total pages needed"""
-        available = self.get_available_players()
-        return (len(available) + self.players_per_page - 1) // self.players_per_page
+        if available_players is None:
+            available_players = self.get_available_players()
+        return (len(available_players) + self.players_per_page - 1) // self.players_per_page
     
-    def update_view(self):
-        """Update the view with pagination"""
+    def update_view(self, available_players=None):
+        """Update the view with pagination (reusing available_players if already computed)"""
         self.clear_items()
         
-        available_players = self.get_available_players()
-        total_pages = self.get_total_pages()
-        
-        if not available_players:
-            return
+        if available_players is None:
+            available_players = self.get_available_players()
+        total_pages = self.get_total_pages(available_players)
         
         # Calculate pagination
         start_idx = self.page * self.players_per_page
         end_idx = start_idx + self.players_per_page
-        page_players = available_players[start_idx:end_idx]
+        options, player_list = self.get_rendered_page(available_players[start_idx:end_idx])
         
-        # Create select menu for current page
-        options = []
-        for name, pos in page_players:
-            options.append(
-                discord.SelectOption(
-                    label=f"#{pos} - {name}"[:100],
-                    value=name,
-                    description=f"Remove this player"
-                )
-            )
+        # Shared with update_message so the page is only computed once per click
+        self._page_state = (available_players, total_pages, player_list)
         
+        if not available_players:
+            return
+        
+        # Select menu for current page
         if options:
-            select = Select(
-                placeholder=f"Page {self.page + 1}/{total_pages} - Select player(s) to remove...",
-                options=options,
-                min_values=1,
-                max_values=len(options)
-            )
-            select.callback = self.player_selected
-            self.add_item(select)
+            self._select.options = options
+            self._select.placeholder = f"Page {self.page + 1}/{total_pages} - Select player(s) to remove..."
+            self._select.max_values = len(options)
+            self.add_item(self._select)
         
         # Navigation buttons (in a row)
         if self.page > 0:
-            prev_button = Button(label="◀ Previous", style=discord.ButtonStyle.secondary, row=1)
-            prev_button.callback = self.previous_page
-            self.add_item(prev_button)
+            self.add_item(self._prev_button)
         
         if self.page < total_pages - 1:
-            next_button = Button(label="Next ▶", style=discord.ButtonStyle.secondary, row=1)
-            next_button.callback = self.next_page
-            self.add_item(next_button)
+            self.add_item(self._next_button)
         
         # Action buttons (in a new row)
-        done_button = Button(label="✅ Done - Recalculate Bounties", style=discord.ButtonStyle.success, row=2)
-        done_button.callback = self.done_editing
-        self.add_item(done_button)
-        
-        cancel_button = Button(label="❌ Cancel", style=discord.ButtonStyle.danger, row=2)
-        cancel_button.callback = self.cancel_editing
-        self.add_item(cancel_button)
+        self.add_item(self._done_button)
+        self.add_item(self._cancel_button)
     
     async def previous_page(self, interaction: discord.Interaction):
         """Go to previous page"""
@@ -706,54 +1426,50 @@ class PlayerRemovalView(View):
     
     async def next_page(self, interaction: discord.Interaction):
         """Go to next page"""
-        total_pages = self.get_total_pages()
-        self.page = min(total_pages - 1, self.page + 1)
-        self.update_view()
+        available_players = self.get_available_players()
+        self.page = min(self.get_total_pages(available_players) - 1, self.page + 1)
+        self.update_view(available_players)
         await self.update_message(interaction)
     
     async def update_message(self, interaction: discord.Interaction):
         """Update the message content"""
-        available_players = self.get_available_players()
-        total_pages = self.get_total_pages()
+        available_players, total_pages, player_list = self._page_state
         
-        start_idx = self.page * self.players_per_page
-        end_idx = start_idx + self.players_per_page
-        page_players = available_players[start_idx:end_idx]
-        
-        player_list = "\n".join([f"#{pos} - {name}" for name, pos in page_players])
-        
-        content = f"**🛠️ Edit Last Game Results**\n\n"
-        content += f"Total Players: {self.game_data['total_players']} | Available: {len(available_players)}\n"
-        content += f"Page {self.page + 1}/{total_pages}\n\n"
+        # Collected as parts and joined once rather than grown by repeated +=
+        parts = [
+            "**🛠️ Edit Last Game Results**\n\n",
+            f"Total Players: {self.game_data['total_players']} | Available: {len(available_players)}\n",
+            f"Page {self.page + 1}/{total_pages}\n\n",
+        ]
         
         if self.removed_players:
             removed_list = ", ".join(self.removed_players[:10])
             if len(self.removed_players) > 10:
                 removed_list += f" +{len(self.removed_players) - 10} more"
-            content += f"**Removed ({len(self.removed_players)}):** {removed_list}\n\n"
+            parts.append(f"**Removed ({len(self.removed_players)}):** {removed_list}\n\n")
         
-        content += f"**Players on this page:**\n{player_list}\n\n"
-        content += "Select players to remove, navigate pages, or click Done:"
+        parts.append(f"**Players on this page:**\n{player_list}\n\n")
+        parts.append("Select players to remove, navigate pages, or click Done:")
         
-        await interaction.response.edit_message(content=content, view=self)
+        await interaction.response.edit_message(content="".join(parts), view=self)
     
     async def player_selected(self, interaction: discord.Interaction):
         """Handle player removal selection"""
-        selected_players = interaction.data['values']
-        
-        for player in selected_players:
-            if player not in self.removed_players:
-                self.removed_players.append(player)
+        # New picks only, deduplicated but kept in the order they were selected
+        removed_set = self.removed_set
+        new_players = [player for player in dict.fromkeys(interaction.data['values']) if player not in removed_set]
+        self.removed_players.extend(new_players)
+        removed_set.update(new_players)
         
         # Recalculate pagination (players might be removed from current page)
         available_players = self.get_available_players()
-        total_pages = self.get_total_pages()
+        total_pages = self.get_total_pages(available_players)
         
         # Adjust page if current page is now empty
         if self.page >= total_pages and total_pages > 0:
             self.page = total_pages - 1
         
-        self.update_view()
+        self.update_view(available_players)
         await self.update_message(interaction)
     
     async def done_editing(self, interaction: discord.Interaction):
@@ -767,32 +1483,35 @@ class PlayerRemovalView(View):
         
         await interaction.response.defer()
         
-        # Revert the bounties from the original game
-        global bounty_board
-        total_players = self.game_data['total_players']
+        # Revert exactly what the original game awarded each player
+        original_bounties = dict(zip(self.game_data['names'], self.game_data['bounties']))
+        
+        reverted_players = []
+        deleted_players = []
         
-        for player_name, position in self.game_data['results']:
-            is_winner = (position == 1)
-            bounty = calculate_bounty(position, total_players, is_winner)
+        for player_name, bounty in original_bounties.items():
+            current = bounty_board.get(player_name, _MISSING)
+            if current is _MISSING:
+                continue
             
-            if player_name in bounty_board:
-                bounty_board[player_name] -= bounty
-                if bounty_board[player_name] == 0:
-                    del bounty_board[player_name]
-        
-        # Create new results without removed players
-        filtered_results = [
-            (name, pos) for name, pos in self.game_data['results']
-            if name not in self.removed_players
-        ]
+            new_bounty = current - bounty
+            if new_bounty == 0:
+                deleted_players.append(player_name)
+            else:
+                set_bounty(player_name, new_bounty)
+                reverted_players.append(player_name)
         
-        # Recalculate positions (1, 2, 3, ... without gaps)
-        new_results = [(name, idx + 1) for idx, (name, _) in enumerate(filtered_results)]
+        delete_bounties(deleted_players)
+        save_bounty_changes(updated=reverted_players, removed=deleted_players)
         
-        # Create new parsed data
+        # Create new results without removed players (one filtering pass, no intermediate tuples)
+        new_names = list(itertools.filterfalse(self.removed_set.__contains__, self.game_data['names']))
+        
+        # Create new parsed data, recalculating positions (1, 2, 3, ... without gaps)
         new_game_data = {
-            'total_players': len(new_results),
-            'results': new_results
+            'total_players': len(new_names),
+            'names': new_names,
+            'positions': list(range(1, len(new_names) + 1))
         }
         
         # Update bounty board with corrected data
@@ -803,22 +1522,18 @@ class PlayerRemovalView(View):
         if len(self.removed_players) > 20:
             removed_list += f" +{len(self.removed_players) - 20} more"
         
-        await interaction.followup.send(
-            f"✅ **Game Results Updated!**\n\n**Removed {len(self.removed_players)} players:** {removed_list}\n\n**Recalculating bounties...**"
-        )
-        
-        game_results_messages = format_game_results(new_game_data)
-        for result_msg in game_results_messages:
-            await interaction.followup.send(result_msg)
+        confirmation = f"✅ **Game Results Updated!**\n\n**Removed {len(self.removed_players)} players:** {removed_list}\n\n**Recalculating bounties...**"
         
-        leaderboard_messages = format_leaderboard()
-        for leaderboard_msg in leaderboard_messages:
-            await interaction.followup.send(leaderboard_msg)
-        
-        # Clear the original message
-        await interaction.message.edit(
-            content=f"✅ Game results updated! Removed {len(self.removed_players)} player(s).",
-            view=None
+        # Post the corrected results and leaderboard while clearing the original message
+        await asyncio.gather(
+            send_in_order(
+                interaction.followup,
+                itertools.chain([confirmation], format_game_results(new_game_data), format_leaderboard())
+            ),
+            interaction.message.edit(
+                content=f"✅ Game results updated! Removed {len(self.removed_players)} player(s).",
+                view=None
+            )
         )
     
     async def cancel_editing(self, interaction: discord.Interaction):
@@ -832,81 +1547,132 @@ class PlayerRemovalView(View):
 # DISPLAY FUNCTIONS
 # =============================================================================
 
-def format_leaderboard() -> List[str]:
-    """Format bounty board as a nice leaderboard string, split into multiple messages if needed"""
-    if not bounty_board:
-        return ["🏆 **BOUNTY LEADERBOARD** 🏆\n\n*No bounties recorded yet!*"]
+# Medals for the top three leaderboard ranks
+MEDALS = ("🥇", "🥈", "🥉")
+
+# Table row templates, bound once: calling a prepared str.format is a little
+# quicker than evaluating an f-string per row on large boards
+_LEADERBOARD_ROW = "{} {:<3} {:<20} {:>10}\n".format
+_RESULT_ROW = "{}{:<4} {:<20} {:>+10}\n".format
+
+def split_table_messages(rows: List[str], title: str, continued_title: str, table_header: str) -> Iterator[str]:
+    """
+    Pack table rows into as few Discord messages as possible.
     
-    # Sort by bounty (descending)
-    sorted_players = sorted(bounty_board.items(), key=lambda x: x[1], reverse=True)
+    Split points are found by binary search over the cumulative row lengths
+    instead of length-checking every row.
     
-    messages = []
-    current_message = "🏆 **BOUNTY LEADERBOARD** 🏆\n\n"
-    current_message += "```\n"
-    current_message += f"{'Rank':<6} {'Player':<20} {'Bounty':>10}\n"
-    current_message += "─" * 40 + "\n"
-    
-    for rank, (player, bounty) in enumerate(sorted_players, 1):
-        medal = "🥇" if rank == 1 else "🥈" if rank == 2 else "🥉" if rank == 3 else "   "
-        line = f"{medal} {rank:<3} {player:<20} {bounty:>10}\n"
-        
-        # Check if adding this line would exceed Discord's limit
-        if len(current_message) + len(line) + 10 > 1900:
-            # Close current message and start a new one
-            current_message += "```"
-            messages.append(current_message)
-            
-            # Start new message
-            current_message = "🏆 **BOUNTY LEADERBOARD (continued)** 🏆\n\n"
-            current_message += "```\n"
-            current_message += f"{'Rank':<6} {'Player':<20} {'Bounty':>10}\n"
-            current_message += "─" * 40 + "\n"
-        
-        current_message += line
+    Args:
+        rows: Table rows, each ending in a newline
+        title: Heading for the first message
+        continued_title: Heading for every following message
+        table_header: Opening code fence plus column headers
     
-    # Close final message
-    current_message += "```"
-    messages.append(current_message)
+    Yields:
+        Messages that each stay under Discord's length limit, joined only when requested
+    """
+    # Small tables (the usual case) fit in one message, so skip the split search
+    if len(title) + len(table_header) + sum(map(len, rows)) + 10 <= 1900:
+        yield "".join([title, table_header, *rows, "```"])
+        return
     
-    return messages
+    cumulative = [0, *itertools.accumulate(map(len, rows))]
+    
+    start = 0
+    heading = title
+    while True:
+        # Leave room for the closing ``` (1900 to be safe)
+        budget = 1900 - 10 - len(heading) - len(table_header)
+        end = bisect.bisect_right(cumulative, cumulative[start] + budget) - 1
+        end = max(end, start + 1)  # always make progress, even on an oversized row
+        yield "".join([heading, table_header, *rows[start:end], "```"])
+        
+        if end >= len(rows):
+            return
+        start = end
+        heading = continued_title
 
-def format_game_results(parsed_data: Dict) -> List[str]:
-    """Format individual game results, split into multiple messages if needed"""
-    total_players = parsed_data['total_players']
-    results = parsed_data['results']
+# (board_version, limit, messages) from the last fully formatted leaderboard
+_leaderboard_cache: Optional[Tuple[int, Optional[int], List[str]]] = None
+
+def format_leaderboard(limit: Optional[int] = LEADERBOARD_LIMIT) -> Iterator[str]:
+    """
+    Format bounty board as a nice leaderboard string, split into multiple messages if needed.
+    Messages are generated one at a time so the first can be sent while the rest are built,
+    and reused as-is until the board changes.
     
+    Args:
+        limit: Only include the top N players (None includes everyone)
+    """
+    global _leaderboard_cache
+    if _leaderboard_cache is not None and _leaderboard_cache[:2] == (board_version, limit):
+        yield from _leaderboard_cache[2]
+        return
+    
+    version = board_version
     messages = []
-    current_message = f"🏁 **RACE RESULTS** (Total Players: {total_players})\n\n"
-    current_message += "```\n"
-    current_message += f"{'Pos':<5} {'Player':<20} {'Bounty':>10}\n"
-    current_message += "─" * 40 + "\n"
-    
-    for player_name, position in results:
-        is_winner = (position == 1)
-        bounty = calculate_bounty(position, total_players, is_winner)
-        medal = "👑" if is_winner else "   "
-        
-        line = f"{medal}{position:<4} {player_name:<20} {bounty:>+10}\n"
-        
-        # Check if adding this line would exceed Discord's limit (leaving room for closing ```)
-        if len(current_message) + len(line) + 10 > 1900:  # 1900 to be safe
-            # Close current message and start a new one
-            current_message += "```"
-            messages.append(current_message)
-            
-            # Start new message
-            current_message = "🏁 **RACE RESULTS (continued)**\n\n"
-            current_message += "```\n"
-            current_message += f"{'Pos':<5} {'Player':<20} {'Bounty':>10}\n"
-            current_message += "─" * 40 + "\n"
-        
-        current_message += line
+    for message in render_leaderboard(limit):
+        messages.append(message)
+        yield message
+    
+    # Only cache a complete render of a board that didn't change mid-way
+    if version == board_version:
+        _leaderboard_cache = (version, limit, messages)
+
+def render_leaderboard(limit: Optional[int]) -> Iterator[str]:
+    """Format the leaderboard messages from scratch (see format_leaderboard)"""
+    if not bounty_board:
+        yield "🏆 **BOUNTY LEADERBOARD** 🏆\n\n*No bounties recorded yet!*"
+        return
     
-    # Close final message
-    current_message += "```"
-    messages.append(current_message)
+    # Already sorted by bounty (descending), so the top N is just a prefix
+    rows = [
+        _LEADERBOARD_ROW(MEDALS[rank - 1] if rank <= 3 else '   ', rank, player, bounty)
+        for rank, (player, bounty) in enumerate(iter_leaderboard(limit), 1)
+    ]
+    
+    title = "🏆 **BOUNTY LEADERBOARD** 🏆\n\n"
+    if limit is not None and len(bounty_board) > limit:
+        title = f"🏆 **BOUNTY LEADERBOARD (Top {limit})** 🏆\n\n"
+    
+    yield from split_table_messages(
+        rows,
+        title,
+        "🏆 **BOUNTY LEADERBOARD (continued)** 🏆\n\n",
+        f"```\n{'Rank':<6} {'Player':<20} {'Bounty':>10}\n" + "─" * 40 + "\n"
+    )
+
+def format_game_results(parsed_data: Dict) -> Iterator[str]:
+    """Format individual game results, split into multiple messages if needed (generated one at a time)"""
+    total_players = parsed_data['total_players']
+    names = parsed_data['names']
+    positions = parsed_data['positions']
+    bounties = parsed_data.get('bounties')
+    if bounties is None:
+        bounties = calculate_bounties(np.asarray(positions, dtype=np.int64), total_players).tolist()
+    
+    rows = [
+        _RESULT_ROW('👑' if position == 1 else '   ', position, player_name, bounty)
+        for player_name, position, bounty in zip(names, positions, bounties)
+    ]
+    
+    yield from split_table_messages(
+        rows,
+        f"🏁 **RACE RESULTS** (Total Players: {total_players})\n\n",
+        "🏁 **RACE RESULTS (continued)**\n\n",
+        f"```\n{'Pos':<5} {'Player':<20} {'Bounty':>10}\n" + "─" * 40 + "\n"
+    )
+
+async def send_in_order(followup: discord.Webhook, messages: Iterable[str]):
+    """
+    Send follow-up messages one at a time.
     
-    return messages
+    Concurrent sends would finish in whatever order Discord answers them, so a
+    split leaderboard could show up shuffled; callers overlap this with other
+    independent requests instead.
+    """
+    for msg in messages:
+        await followup.send(msg)
 
 # =============================================================================
 # BOT EVENTS
@@ -964,7 +1730,7 @@ async def submit_marbles(
 
     # Validate all are images
     for screenshot in screenshots:
-        if not any(screenshot.filename.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.gif', '.bmp', '.webp']):
+        if not is_image_attachment(screenshot):
             await interaction.response.send_message(
                 f"❌ {screenshot.filename} is not an image file. Please upload PNG, JPG, GIF, etc.",
                 ephemeral=True
@@ -976,67 +1742,75 @@ async def submit_marbles(
     
     try:
         all_parsed_data = []
+        screenshot_data = []
+        screenshot_indexes = []
         
-        # Process each screenshot
-        for idx, screenshot in enumerate(screenshots, 1):
-            await interaction.followup.send(f"🔍 Processing screenshot {idx}/{len(screenshots)}...", ephemeral=True)
-            
-            # Download image
-            image = await download_image_from_attachment(screenshot)
-            if not image:
-                await interaction.followup.send(f"❌ Failed to download screenshot {idx}.", ephemeral=True)
+        # One ephemeral progress message, edited as processing goes, instead of a message per step
+        status_lines = [f"🔍 Processing {len(screenshots)} screenshot(s)..."]
+        progress = await interaction.followup.send(status_lines[0], ephemeral=True, wait=True)
+        
+        # Download all screenshots concurrently
+        downloaded = await asyncio.gather(*[download_attachment(ss) for ss in screenshots])
+        
+        for idx, data in enumerate(downloaded, 1):
+            if data is None:
+                status_lines.append(f"❌ Failed to download screenshot {idx}.")
                 continue
             
-            # Perform OCR
-            ocr_text = perform_ocr(image)
-            
+            screenshot_data.append(data)
+            screenshot_indexes.append(idx)
+        
+        # Perform OCR on all screenshots, updating the progress message meanwhile
+        ocr_texts, _ = await asyncio.gather(
+            read_screenshots(screenshot_data),
+            progress.edit(content="\n".join(status_lines + [f"📖 Reading {len(screenshot_data)} screenshot(s)..."]))
+        )
+        
+        for idx, ocr_text in zip(screenshot_indexes, ocr_texts):
             if not ocr_text:
-                await interaction.followup.send(f"❌ Could not extract text from screenshot {idx}.", ephemeral=True)
+                status_lines.append(f"❌ Could not extract text from screenshot {idx}.")
                 continue
             
             # Parse results
             parsed_data = parse_marbles_screenshot(ocr_text)
             
             if not parsed_data:
-                await interaction.followup.send(
-                    f"❌ Could not parse screenshot {idx}. Skipping...",
-                    ephemeral=True
-                )
+                status_lines.append(f"❌ Could not parse screenshot {idx}. Skipping...")
                 continue
             
             all_parsed_data.append(parsed_data)
         
         if not all_parsed_data:
-            await interaction.followup.send(
-                "❌ Could not parse any screenshots. Make sure they are Marbles on Stream end screens!",
-                ephemeral=True
-            )
+            status_lines.append("❌ Could not parse any screenshots. Make sure they are Marbles on Stream end screens!")
+            await progress.edit(content="\n".join(status_lines))
             return
         
         # Merge multiple screenshots if needed
         if len(all_parsed_data) > 1:
             merged_data = merge_screenshot_data(all_parsed_data)
-            await interaction.followup.send(
-                f"✅ Merged {len(all_parsed_data)} screenshots into {merged_data['total_players']} unique players!",
-                ephemeral=True
+            status_lines.append(
+                f"✅ Merged {len(all_parsed_data)} screenshots into {merged_data['total_players']} unique players!"
             )
         else:
             merged_data = all_parsed_data[0]
+            status_lines.append(f"✅ Found {merged_data['total_players']} players!")
         
         # Update bounty board
         update_bounty_board(merged_data)
         
-        # Send results (publicly in channel) - split into multiple messages if needed
-        game_results_messages = format_game_results(merged_data)
-        
-        await interaction.followup.send(f"✅ Processed by {interaction.user.mention}")
-        
-        for result_msg in game_results_messages:
-            await interaction.followup.send(result_msg)
-        
-        leaderboard_messages = format_leaderboard()
-        for leaderboard_msg in leaderboard_messages:
-            await interaction.followup.send(leaderboard_msg)
+        # Send results (publicly in channel) - split into multiple messages if needed -
+        # while the progress message gets its final status
+        await asyncio.gather(
+            progress.edit(content="\n".join(status_lines)),
+            send_in_order(
+                interaction.followup,
+                itertools.chain(
+                    [f"✅ Processed by {interaction.user.mention}"],
+                    format_game_results(merged_data),
+                    format_leaderboard()
+                )
+            )
+        )
         
     except Exception as e:
         print(f"Error processing screenshot: {e}")
@@ -1048,29 +1822,21 @@ async def submit_marbles(
 async def leaderboard_slash(interaction: discord.Interaction):
     """Show current bounty leaderboard"""
     leaderboard_messages = format_leaderboard()
-    await interaction.response.send_message(leaderboard_messages[0])
+    await interaction.response.send_message(next(leaderboard_messages))
     
     # Send additional messages if leaderboard is split
-    for leaderboard_msg in leaderboard_messages[1:]:
-        await interaction.followup.send(leaderboard_msg)
+    await send_in_order(interaction.followup, leaderboard_messages)
 
 @bot.tree.command(name="bounty", description="Check a player's current bounty")
 @app_commands.describe(player="The player name to look up")
 async def bounty_slash(interaction: discord.Interaction, player: str):
     """Show bounty for a specific player"""
-    # Try exact match first
-    if player in bounty_board:
-        bounty = bounty_board[player]
-        await interaction.response.send_message(f"💰 **{player}** has a bounty of **{bounty:+}** points!")
+    # Exact match first, then case-insensitive
+    name = find_player(player)
+    if name is not None:
+        await interaction.response.send_message(f"💰 **{name}** has a bounty of **{bounty_board[name]:+}** points!")
         return
     
-    # Try case-insensitive match
-    player_lower = player.lower()
-    for name, bounty in bounty_board.items():
-        if name.lower() == player_lower:
-            await interaction.response.send_message(f"💰 **{name}** has a bounty of **{bounty:+}** points!")
-            return
-    
     await interaction.response.send_message(f"❌ Player **{player}** not found in bounty board.", ephemeral=True)
 
 @bot.tree.command(name="edit_leaderboard", description="Edit the leaderboard - remove incorrect players (Admin only)")
@@ -1087,23 +1853,17 @@ async def edit_leaderboard(interaction: discord.Interaction):
     # Create interactive view with pagination
     view = LeaderboardEditView()
     
-    # Get sorted leaderboard
-    sorted_players = sorted(bounty_board.items(), key=lambda x: x[1], reverse=True)
-    players_per_page = 25
-    page_players = sorted_players[:players_per_page]
-    total_pages = (len(sorted_players) + players_per_page - 1) // players_per_page
+    # First page, as already rendered by the view
+    _, total_pages, player_list = view._page_state
     
-    player_list = "\n".join([
-        f"#{rank} {name} ({bounty:+})" 
-        for rank, (name, bounty) in enumerate(page_players, 1)
+    content = "".join([
+        "**🛠️ Edit Leaderboard**\n\n",
+        f"Total Players: {len(sorted_board)}\n",
+        f"Page 1/{total_pages}\n\n",
+        f"**Players on this page:**\n{player_list}\n\n",
+        "Select players to remove, use ◀ Next ▶ to navigate, or click Done:",
     ])
     
-    content = f"**🛠️ Edit Leaderboard**\n\n"
-    content += f"Total Players: {len(sorted_players)}\n"
-    content += f"Page 1/{total_pages}\n\n"
-    content += f"**Players on this page:**\n{player_list}\n\n"
-    content += "Select players to remove, use ◀ Next ▶ to navigate, or click Done:"
-    
     await interaction.response.send_message(
         content=content,
         view=view,
@@ -1135,18 +1895,16 @@ async def edit_last_game(interaction: discord.Interaction):
     # Create interactive view with pagination
     view = PlayerRemovalView(last_game_data)
     
-    # Show first page
-    players_per_page = 25
-    page_players = last_game_data['results'][:players_per_page]
-    total_pages = (len(last_game_data['results']) + players_per_page - 1) // players_per_page
+    # Show first page, as already rendered by the view
+    _, total_pages, player_list = view._page_state
     
-    player_list = "\n".join([f"#{pos} - {name}" for name, pos in page_players])
-    
-    content = f"**🛠️ Edit Last Game Results**\n\n"
-    content += f"Total Players: {last_game_data['total_players']}\n"
-    content += f"Page 1/{total_pages}\n\n"
-    content += f"**Players on this page:**\n{player_list}\n\n"
-    content += "Select players to remove, use ◀ Next ▶ to navigate, or click Done:"
+    content = "".join([
+        "**🛠️ Edit Last Game Results**\n\n",
+        f"Total Players: {last_game_data['total_players']}\n",
+        f"Page 1/{total_pages}\n\n",
+        f"**Players on this page:**\n{player_list}\n\n",
+        "Select players to remove, use ◀ Next ▶ to navigate, or click Done:",
+    ])
     
     await interaction.response.send_message(
         content=content,
@@ -1168,30 +1926,16 @@ async def edit_last_game_error(interaction: discord.Interaction, error: app_comm
 @app_commands.checks.has_permissions(administrator=True)
 async def remove_player(interaction: discord.Interaction, player: str):
     """Remove a player completely from the bounty board"""
-    global bounty_board
-    
-    # Try exact match
-    if player in bounty_board:
-        bounty = bounty_board[player]
-        del bounty_board[player]
-        save_bounty_board(bounty_board)
+    # Exact match first, then case-insensitive
+    name = find_player(player)
+    if name is not None:
+        bounty = delete_bounty(name)
+        save_bounty_changes(removed=[name])
         await interaction.response.send_message(
-            f"✅ Removed **{player}** (had {bounty:+} bounty) from the leaderboard!"
+            f"✅ Removed **{name}** (had {bounty:+} bounty) from the leaderboard!"
         )
         return
     
-    # Try case-insensitive
-    player_lower = player.lower()
-    for name in list(bounty_board.keys()):
-        if name.lower() == player_lower:
-            bounty = bounty_board[name]
-            del bounty_board[name]
-            save_bounty_board(bounty_board)
-            await interaction.response.send_message(
-                f"✅ Removed **{name}** (had {bounty:+} bounty) from the leaderboard!"
-            )
-            return
-    
     await interaction.response.send_message(
         f"❌ Player **{player}** not found in bounty board.",
         ephemeral=True
@@ -1210,9 +1954,8 @@ async def remove_player_error(interaction: discord.Interaction, error: app_comma
 @app_commands.checks.has_permissions(administrator=True)
 async def reset_slash(interaction: discord.Interaction):
     """Reset the entire bounty board (Admin only)"""
-    global bounty_board
-    bounty_board = {}
-    save_bounty_board(bounty_board)
+    clear_bounties()
+    save_bounty_changes(reset=True)
     await interaction.response.send_message("🔄 Bounty board has been reset!")
 
 @reset_slash.error
@@ -1283,17 +2026,11 @@ async def show_leaderboard(ctx):
 @bot.command(name='bounty')
 async def show_bounty(ctx, *, player_name: str):
     """Show bounty for a specific player (text command)"""
-    if player_name in bounty_board:
-        bounty = bounty_board[player_name]
-        await ctx.send(f"💰 **{player_name}** has a bounty of **{bounty:+}** points!")
+    name = find_player(player_name)
+    if name is not None:
+        await ctx.send(f"💰 **{name}** has a bounty of **{bounty_board[name]:+}** points!")
         return
     
-    player_lower = player_name.lower()
-    for name, bounty in bounty_board.items():
-        if name.lower() == player_lower:
-            await ctx.send(f"💰 **{name}** has a bounty of **{bounty:+}** points!")
-            return
-    
     await ctx.send(f"❌ Player **{player_name}** not found in bounty board.")
 
 # =============================================================================
@@ -1301,6 +2038,7 @@ async def show_bounty(ctx, *, player_name: str):
 # =============================================================================
 
 if __name__ == '__main__':
+    logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
     print("🚀 Starting Marbles on Stream Discord Bot (Position-Based Ranking)...")
     print("⚠️  Make sure you've set BOT_TOKEN!")
     
@@ -1308,9 +2046,18 @@ if __name__ == '__main__':
         print("❌ ERROR: Please set your bot token in the code!")
         exit(1)
     
+    if USE_OCR_POOL:
+        print(f"🔧 Starting {OCR_WORKERS} OCR worker process(es)...")
+        ocr_pool = OCRPool(OCR_WORKERS, OCR_ENGINE, OCR_USE_GPU)
+        atexit.register(ocr_pool.terminate)
+    
     try:
-        bot.run(BOT_TOKEN)
+        # Logging is already set up above; discord.py's own handler would print every record twice
+        bot.run(BOT_TOKEN, log_handler=None)
     except discord.LoginFailure:
         print("❌ ERROR: Invalid bot token!")
     except Exception as e:
-        print(f"❌ ERROR: {e}")
\ No newline at end of file
+        print(f"❌ ERROR: {e}")
+    finally:
+        # Don't lose edits still waiting on the save timer
+        flush_pending_save()
\ No newline at end of file